@@ -1,87 +1,229 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+from matplotlib.figure import Figure
 import json
+import numbers
 import os
-import sys
+import re
+import shutil
+import threading
+import uuid
 from datetime import datetime
-import time
+from sortedcontainers import SortedKeyList
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import our AI Interviewer models
 from models import InterviewerAgent, TechnicalSkillsModel, BehavioralSkillsModel
 
+# One JSON file per candidate, named after the candidate id
+CANDIDATES_DIR = 'data/candidates'
+CANDIDATE_FILE_RE = re.compile(r'C(\d+)\.json')
+META_PATH = 'data/meta.json'
+
+# Single-file store used before CANDIDATES_DIR; imported once if present
+LEGACY_CANDIDATES_PATH = 'data/candidates.json'
+
+POSITIONS = ("Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer", "Other")
+
+# Positions that get technical questions
+TECHNICAL_POSITIONS = frozenset({"Software Engineer", "Data Scientist", "DevOps Engineer"})
+
+# Maximum number of ranking rows sent to the browser at once
+RANKINGS_PAGE_SIZE = 200
+
+
+def _json_loads(data):
+    """Decode JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Encode obj to JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _scale_scores(assessment):
+    """Return the numeric scores of an assessment as integer percentages"""
+    return {
+        k: int(round(v * 100))
+        for k, v in assessment.items()
+        if isinstance(v, numbers.Real) and not isinstance(v, bool)
+    }
+
+
+def _read_json(path):
+    """Read and decode a JSON file"""
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _write_atomic(path, data):
+    """Write bytes to path via a temporary file so readers never see a partial file"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _import_legacy_candidates():
+    """Write the legacy roster out as CANDIDATES_DIR if it does not exist yet"""
+    if os.path.isdir(CANDIDATES_DIR) or not os.path.exists(LEGACY_CANDIDATES_PATH):
+        return
+    
+    candidates = _read_json(LEGACY_CANDIDATES_PATH)
+    
+    # Build the directory aside and rename it so an interrupted import is redone
+    tmp_dir = CANDIDATES_DIR + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    for c in candidates:
+        with open(os.path.join(tmp_dir, f"{c['id']}.json"), 'wb') as f:
+            f.write(_json_dumps(c))
+    os.rename(tmp_dir, CANDIDATES_DIR)
+
+
+@st.cache_resource
+def _get_interviewer():
+    """Create the interviewer agent once per process"""
+    return InterviewerAgent()
+
+
+def _read_candidates_dir(path):
+    """Parse every candidate file in a directory"""
+    # Ignore anything not named like a candidate file, e.g. backup copies
+    matches = [CANDIDATE_FILE_RE.fullmatch(name) for name in os.listdir(path)]
+    # Keep candidates in the order they were added
+    matches = sorted((m for m in matches if m), key=lambda m: int(m.group(1)))
+    candidates = [_read_json(os.path.join(path, m.group(0))) for m in matches]
+    
+    # Records written before display scores were stored
+    for c in candidates:
+        if c.get("assessment") and "assessment_display" not in c:
+            c["assessment_display"] = _scale_scores(c["assessment"])
+    
+    return candidates
+
+
 class AIInterviewerApp:
-    """Main application class for AI Interviewer"""
+    """Main application class for AI Interviewer
+    
+    One instance is shared by every browser session, so roster updates are
+    serialized with a lock. The interviewer agent holds the state of a single
+    interview: starting an interview hands it to the calling session, and
+    responses from any other session are rejected.
+    """
     
     def __init__(self):
-        self.interviewer = InterviewerAgent()
+        self.interviewer = _get_interviewer()
+        self._lock = threading.Lock()
         self.candidates = self._load_candidates()
+        self._by_id = {c["id"]: c for c in self.candidates}
+        # Assessed candidates, kept ordered by descending overall score
+        self._assessed = SortedKeyList(
+            (c for c in self.candidates if c.get("assessment")),
+            key=lambda c: -c["assessment"]["overall_score"]
+        )
+        # Candidates still waiting for an interview
+        self._pending = {c["id"]: c for c in self.candidates if c["status"] == "Pending"}
+        self._next_id = self._load_next_id()
         self.current_candidate = None
-        self.interview_in_progress = False
+        # Session that currently owns the interviewer agent
+        self._interview_session = None
     
     def _load_candidates(self):
         """Load candidate data from file"""
-        try:
-            with open('data/candidates.json', 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Return empty list if file not found
+        _import_legacy_candidates()
+        if not os.path.isdir(CANDIDATES_DIR):
+            # Return empty list if directory not found
             return []
+        
+        return _read_candidates_dir(CANDIDATES_DIR)
+    
+    def _load_next_id(self):
+        """Load the next candidate number from the metadata file"""
+        # Never below the existing ids: a crash between writing a candidate
+        # and meta.json leaves the stored counter behind
+        next_id = max((int(c["id"][1:]) for c in self.candidates), default=0) + 1
+        try:
+            return max(_read_json(META_PATH)["next_id"], next_id)
+        except (FileNotFoundError, ValueError, KeyError):
+            # Missing or corrupt; use the highest existing candidate number
+            return next_id
     
-    def _save_candidates(self):
-        """Save candidate data to file"""
+    def _save_meta(self):
+        """Save the next candidate number to the metadata file"""
         os.makedirs('data', exist_ok=True)
-        with open('data/candidates.json', 'w') as f:
-            json.dump(self.candidates, f)
+        _write_atomic(META_PATH, _json_dumps({"next_id": self._next_id}))
+    
+    def _save_candidate(self, candidate):
+        """Save a single candidate record to its own file"""
+        os.makedirs(CANDIDATES_DIR, exist_ok=True)
+        path = os.path.join(CANDIDATES_DIR, f"{candidate['id']}.json")
+        _write_atomic(path, _json_dumps(candidate))
     
     def add_candidate(self, candidate_info):
         """Add a new candidate to the system"""
-        candidate_id = f"C{len(self.candidates) + 1}"
-        candidate_info["id"] = candidate_id
-        candidate_info["interview_date"] = datetime.now().strftime("%Y-%m-%d")
-        candidate_info["status"] = "Pending"
-        candidate_info["assessment"] = None
-        
-        self.candidates.append(candidate_info)
-        self._save_candidates()
+        with self._lock:
+            candidate_id = f"C{self._next_id}"
+            self._next_id += 1
+            candidate_info["id"] = candidate_id
+            candidate_info["interview_date"] = datetime.now().strftime("%Y-%m-%d")
+            candidate_info["status"] = "Pending"
+            candidate_info["assessment"] = None
+            
+            self.candidates.append(candidate_info)
+            self._by_id[candidate_id] = candidate_info
+            self._pending[candidate_id] = candidate_info
+            self._save_candidate(candidate_info)
+            self._save_meta()
         return candidate_id
     
-    def start_interview(self, candidate_id):
-        """Start interview for a candidate"""
-        # Find candidate
-        candidate = next((c for c in self.candidates if c["id"] == candidate_id), None)
-        if not candidate:
-            return False, "Candidate not found"
-        
-        self.current_candidate = candidate
-        self.interview_in_progress = True
-        
-        # Determine focus areas based on position
-        technical_focus = candidate["position"] in ["Software Engineer", "Data Scientist", "DevOps Engineer"]
-        behavioral_focus = True  # Always include behavioral questions
-        
-        # Start interview through the interviewer agent
-        next_question = self.interviewer.start_interview(
-            candidate_id, 
-            technical_focus=technical_focus,
-            behavioral_focus=behavioral_focus
-        )
+    def start_interview(self, candidate_id, session_id):
+        """Start interview for a candidate on behalf of a session"""
+        with self._lock:
+            # Find candidate
+            candidate = self._by_id.get(candidate_id)
+            if not candidate:
+                return False, "Candidate not found"
+            
+            # Any interview another session left unfinished is abandoned
+            self.current_candidate = candidate
+            self._interview_session = session_id
+            
+            # Determine focus areas based on position
+            technical_focus = candidate["position"] in TECHNICAL_POSITIONS
+            behavioral_focus = True  # Always include behavioral questions
+            
+            # Start interview through the interviewer agent
+            next_question = self.interviewer.start_interview(
+                candidate_id, 
+                technical_focus=technical_focus,
+                behavioral_focus=behavioral_focus
+            )
         
         return True, next_question
     
-    def process_response(self, response_text):
-        """Process candidate's response"""
-        if not self.interview_in_progress:
-            return False, "No interview in progress"
-        
-        result = self.interviewer.process_response(response_text)
-        
-        # If no more questions, interview is complete
-        if result["next_question"] is None:
-            self.interview_in_progress = False
-            self._update_candidate_assessment()
+    def process_response(self, response_text, session_id):
+        """Process candidate's response for the session's interview"""
+        with self._lock:
+            if self._interview_session != session_id:
+                return False, "This interview is no longer active; another session took over the interviewer and the answers given so far were not saved"
+            
+            result = self.interviewer.process_response(response_text)
+            
+            # If no more questions, interview is complete
+            if result["next_question"] is None:
+                self._interview_session = None
+                self._update_candidate_assessment()
         
         return True, result
     
@@ -89,40 +231,146 @@ class AIInterviewerApp:
         """Update candidate record with assessment results"""
         assessment = self.interviewer.get_candidate_assessment()
         
-        # Find candidate in list and update
-        for i, candidate in enumerate(self.candidates):
-            if candidate["id"] == self.current_candidate["id"]:
-                self.candidates[i]["status"] = "Interviewed"
-                self.candidates[i]["assessment"] = assessment["assessment"]
-                self.candidates[i]["interview_data"] = {
-                    "technical_responses": assessment["technical_responses"],
-                    "behavioral_responses": assessment["behavioral_responses"]
-                }
-                break
+        # Index entries share references with self.candidates
+        candidate = self._by_id[self.current_candidate["id"]]
+        # Re-assessment changes the sort key, so drop the old entry first
+        if candidate.get("assessment"):
+            self._assessed.remove(candidate)
+        candidate.update({
+            "status": "Interviewed",
+            "assessment": assessment["assessment"],
+            "assessment_display": _scale_scores(assessment["assessment"]),
+            "interview_data": {
+                "technical_responses": assessment["technical_responses"],
+                "behavioral_responses": assessment["behavioral_responses"]
+            }
+        })
+        
+        self._assessed.add(candidate)
+        self._pending.pop(candidate["id"], None)
         
-        self._save_candidates()
+        # Only this candidate's file is rewritten
+        self._save_candidate(candidate)
     
     def get_candidate_rankings(self):
         """Return sorted list of candidates based on assessment scores"""
-        # Filter candidates with assessments
-        assessed_candidates = [c for c in self.candidates if c.get("assessment")]
-        
-        if not assessed_candidates:
-            return []
-        
-        # Sort by overall score
-        sorted_candidates = sorted(
-            assessed_candidates,
-            key=lambda x: x["assessment"]["overall_score"],
-            reverse=True
-        )
-        
-        return sorted_candidates
+        return list(self._assessed)
+    
+    def get_pending_candidates(self):
+        """Return candidates still waiting for an interview"""
+        return list(self._pending.values())
     
     def get_candidate_details(self, candidate_id):
         """Get detailed information for a specific candidate"""
-        candidate = next((c for c in self.candidates if c["id"] == candidate_id), None)
-        return candidate
+        return self._by_id.get(candidate_id)
+    
+    def get_candidate_ids(self):
+        """Return the ids of all candidates in the order they were added"""
+        return list(self._by_id)
+    
+    def get_candidate_label(self, candidate_id):
+        """Return the display label for a candidate"""
+        return f"{self._by_id[candidate_id]['name']} ({candidate_id})"
+
+
+@st.cache_resource
+def _get_app():
+    """Return the shared AIInterviewerApp instance"""
+    return AIInterviewerApp()
+
+
+def _session_id():
+    """Return an id identifying the current browser session"""
+    return st.session_state.setdefault("session_id", uuid.uuid4().hex)
+
+
+@st.cache_data(hash_funcs={Figure: lambda _: None})
+def _score_bar_fig(names, tech, beh):
+    """Build the technical/behavioral score bar chart"""
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    
+    x = np.arange(len(names))
+    width = 0.35
+    
+    ax.bar(x - width/2, tech, width, label="Technical")
+    ax.bar(x + width/2, beh, width, label="Behavioral")
+    
+    ax.set_ylabel("Score")
+    ax.set_title("Candidate Scores")
+    ax.set_xticks(x)
+    ax.set_xticklabels(names)
+    ax.legend()
+    
+    return fig
+
+
+@st.cache_data(hash_funcs={Figure: lambda _: None})
+def _category_barh_fig(cats, scores_pct):
+    """Build the horizontal skill category chart from percentage scores"""
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    y_pos = np.arange(len(cats))
+    
+    bars = ax.barh(y_pos, scores_pct)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(cats)
+    ax.set_xlabel('Score (%)')
+    ax.set_title('Technical Skill Categories')
+    
+    # Add score labels
+    ax.bar_label(bars, labels=[f"{s:.1f}%" for s in scores_pct], padding=3)
+    
+    return fig
+
+
+@st.fragment
+def interview_panel(app):
+    """Render the interview Q&A block; reruns on its own when a response is submitted"""
+    st.subheader("Interview in Progress")
+    
+    # Get current candidate
+    candidate = app.get_candidate_details(st.session_state.interview_candidate_id)
+    st.write(f"Interviewing: {candidate['name']}")
+    
+    # Display current question
+    current_q = st.session_state.get("current_question")
+    
+    if current_q:
+        q_type = current_q["type"].capitalize()
+        st.write(f"**{q_type} Question:**")
+        st.write(current_q["text"])
+        
+        # Get response from user (simulating candidate)
+        response = st.text_area("Answer (simulating candidate response)")
+        
+        if st.button("Submit Response"):
+            if response:
+                success, result = app.process_response(response, _session_id())
+                
+                if success:
+                    if result["next_question"]:
+                        st.session_state.current_question = result["next_question"]
+                        st.success(f"Response processed. {result['remaining_questions']} questions remaining.")
+                        # Only this fragment needs to show the next question
+                        st.rerun(scope="fragment")
+                    else:
+                        st.success("Interview completed!")
+                        st.session_state.interview_active = False
+                        st.session_state.current_question = None
+                        # Candidate status changed, so refresh the whole page
+                        st.rerun()
+                else:
+                    # The interviewer was taken over; drop this session's stale interview
+                    st.session_state.interview_active = False
+                    st.session_state.current_question = None
+                    st.session_state.interview_error = result
+                    st.rerun()
+            else:
+                st.warning("Please enter a response")
+    else:
+        st.info("Interview complete or no questions available")
+        st.session_state.interview_active = False
 
 
 def run_streamlit_dashboard():
@@ -130,7 +378,7 @@ def run_streamlit_dashboard():
     st.set_page_config(page_title="AI Interviewer Dashboard", layout="wide")
     
     # Initialize app
-    app = AIInterviewerApp()
+    app = _get_app()
     
     # Sidebar navigation
     st.sidebar.title("AI Interviewer")
@@ -148,39 +396,42 @@ def run_streamlit_dashboard():
             st.subheader("Candidate Rankings")
             
             # Create DataFrame for display
-            df = pd.DataFrame([
-                {
-                    "ID": c["id"],
-                    "Name": c["name"],
-                    "Position": c["position"],
-                    "Technical Score": round(c["assessment"]["overall_technical_score"] * 100),
-                    "Behavioral Score": round(c["assessment"]["overall_behavioral_score"] * 100),
-                    "Overall Score": round(c["assessment"]["overall_score"] * 100),
-                    "Recommendation": c["assessment"]["recommendation"]
-                }
-                for c in rankings
-            ])
+            # Project only the displayed fields; scores are precomputed percentages
+            df = pd.DataFrame.from_records(
+                [
+                    (
+                        c["id"],
+                        c["name"],
+                        c["position"],
+                        c["assessment_display"]["overall_technical_score"],
+                        c["assessment_display"]["overall_behavioral_score"],
+                        c["assessment_display"]["overall_score"],
+                        c["assessment"]["recommendation"]
+                    )
+                    for c in rankings
+                ],
+                columns=[
+                    "ID", "Name", "Position",
+                    "Technical Score", "Behavioral Score", "Overall Score",
+                    "Recommendation"
+                ]
+            )
             
-            # Display as table
-            st.dataframe(df)
+            # Display as table, one page at a time for large rosters
+            if len(df) > RANKINGS_PAGE_SIZE:
+                start = st.slider("Start row", 0, len(df) - RANKINGS_PAGE_SIZE, 0)
+                st.dataframe(df.iloc[start:start + RANKINGS_PAGE_SIZE])
+            else:
+                st.dataframe(df)
             
             # Visualization
             st.subheader("Score Distribution")
             
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            x = np.arange(len(df))
-            width = 0.35
-            
-            technical = ax.bar(x - width/2, df["Technical Score"], width, label="Technical")
-            behavioral = ax.bar(x + width/2, df["Behavioral Score"], width, label="Behavioral")
-            
-            ax.set_ylabel("Score")
-            ax.set_title("Candidate Scores")
-            ax.set_xticks(x)
-            ax.set_xticklabels(df["Name"])
-            ax.legend()
-            
+            fig = _score_bar_fig(
+                tuple(df["Name"]),
+                tuple(df["Technical Score"].tolist()),
+                tuple(df["Behavioral Score"].tolist())
+            )
             st.pyplot(fig)
     
     elif page == "New Interview":
@@ -192,10 +443,7 @@ def run_streamlit_dashboard():
             
             name = st.text_input("Full Name")
             email = st.text_input("Email")
-            position = st.selectbox(
-                "Position",
-                ["Software Engineer", "Data Scientist", "Product Manager", "DevOps Engineer", "Other"]
-            )
+            position = st.selectbox("Position", POSITIONS)
             experience = st.slider("Years of Experience", 0, 20, 3)
             
             submitted = st.form_submit_button("Add Candidate")
@@ -219,7 +467,7 @@ def run_streamlit_dashboard():
                         st.session_state.interview_candidate_id = candidate_id
                         st.session_state.interview_active = True
                         st.session_state.current_question = None
-                        st.experimental_rerun()
+                        st.rerun()
                 else:
                     st.error("Please fill in all required fields")
         
@@ -227,82 +475,45 @@ def run_streamlit_dashboard():
         st.subheader("Start Interview")
         
         # Get candidates with pending status
-        pending_candidates = [c for c in app.candidates if c["status"] == "Pending"]
+        pending_candidates = app.get_pending_candidates()
         
-        if not pending_candidates:
+        # Reported by an interview that was abandoned on the previous run
+        if st.session_state.get("interview_error"):
+            st.warning(st.session_state.pop("interview_error"))
+        
+        # Interview in progress
+        if st.session_state.get("interview_active", False):
+            interview_panel(app)
+        elif not pending_candidates:
             st.info("No pending candidates available for interview.")
         else:
-            # Only show if not already in interview
-            if not st.session_state.get("interview_active", False):
-                candidate_options = {f"{c['name']} ({c['id']})": c["id"] for c in pending_candidates}
-                selected_candidate = st.selectbox("Select Candidate", list(candidate_options.keys()))
-                selected_id = candidate_options[selected_candidate]
-                
-                if st.button("Start Interview"):
-                    success, result = app.start_interview(selected_id)
-                    
-                    if success:
-                        st.session_state.interview_candidate_id = selected_id
-                        st.session_state.interview_active = True
-                        st.session_state.current_question = result
-                        st.experimental_rerun()
-                    else:
-                        st.error(result)
+            candidate_options = {f"{c['name']} ({c['id']})": c["id"] for c in pending_candidates}
+            selected_candidate = st.selectbox("Select Candidate", list(candidate_options.keys()))
+            selected_id = candidate_options[selected_candidate]
             
-            # Interview in progress
-            if st.session_state.get("interview_active", False):
-                st.subheader("Interview in Progress")
+            if st.button("Start Interview"):
+                success, result = app.start_interview(selected_id, _session_id())
                 
-                # Get current candidate
-                candidate = app.get_candidate_details(st.session_state.interview_candidate_id)
-                st.write(f"Interviewing: {candidate['name']}")
-                
-                # Display current question
-                current_q = st.session_state.get("current_question")
-                
-                if current_q:
-                    q_type = current_q["type"].capitalize()
-                    st.write(f"**{q_type} Question:**")
-                    st.write(current_q["text"])
-                    
-                    # Get response from user (simulating candidate)
-                    response = st.text_area("Answer (simulating candidate response)")
-                    
-                    if st.button("Submit Response"):
-                        if response:
-                            success, result = app.process_response(response)
-                            
-                            if success:
-                                if result["next_question"]:
-                                    st.session_state.current_question = result["next_question"]
-                                    st.success(f"Response processed. {result['remaining_questions']} questions remaining.")
-                                    st.experimental_rerun()
-                                else:
-                                    st.success("Interview completed!")
-                                    st.session_state.interview_active = False
-                                    st.session_state.current_question = None
-                                    st.experimental_rerun()
-                            else:
-                                st.error(result)
-                        else:
-                            st.warning("Please enter a response")
+                if success:
+                    st.session_state.interview_candidate_id = selected_id
+                    st.session_state.interview_active = True
+                    st.session_state.current_question = result
+                    st.rerun()
                 else:
-                    st.info("Interview complete or no questions available")
-                    st.session_state.interview_active = False
+                    st.error(result)
     
     elif page == "Candidate Details":
         st.title("Candidate Details")
         
-        # Get all candidates
-        all_candidates = app.candidates
-        
-        if not all_candidates:
+        if not app.candidates:
             st.info("No candidates in the system.")
         else:
-            # Create selection options
-            candidate_options = {f"{c['name']} ({c['id']})": c["id"] for c in all_candidates}
-            selected_candidate = st.selectbox("Select Candidate", list(candidate_options.keys()))
-            selected_id = candidate_options[selected_candidate]
+            # Labels are formatted on demand from the id index
+            selected_id = st.selectbox(
+                "Select Candidate",
+                app.get_candidate_ids(),
+                format_func=app.get_candidate_label
+            )
             
             # Get detailed info
             candidate = app.get_candidate_details(selected_id)
@@ -315,47 +526,37 @@ def run_streamlit_dashboard():
                 
                 with col1:
                     st.subheader("Basic Information")
-                    st.write(f"**Name:** {candidate['name']}")
-                    st.write(f"**Email:** {candidate['email']}")
-                    st.write(f"**Position:** {candidate['position']}")
-                    st.write(f"**Experience:** {candidate['experience']} years")
-                    st.write(f"**Status:** {candidate['status']}")
-                    st.write(f"**Interview Date:** {candidate.get('interview_date', 'N/A')}")
+                    st.markdown("\n\n".join([
+                        f"**Name:** {candidate['name']}",
+                        f"**Email:** {candidate['email']}",
+                        f"**Position:** {candidate['position']}",
+                        f"**Experience:** {candidate['experience']} years",
+                        f"**Status:** {candidate['status']}",
+                        f"**Interview Date:** {candidate.get('interview_date', 'N/A')}"
+                    ]))
                 
                 # Assessment info (if available)
                 if candidate.get("assessment"):
                     with col2:
                         st.subheader("Assessment Summary")
-                        st.write(f"**Overall Score:** {round(candidate['assessment']['overall_score'] * 100)}%")
-                        st.write(f"**Technical Score:** {round(candidate['assessment']['overall_technical_score'] * 100)}%")
-                        st.write(f"**Behavioral Score:** {round(candidate['assessment']['overall_behavioral_score'] * 100)}%")
-                        st.write(f"**Recommendation:** {candidate['assessment']['recommendation']}")
+                        display = candidate['assessment_display']
+                        st.markdown("\n\n".join([
+                            f"**Overall Score:** {display['overall_score']}%",
+                            f"**Technical Score:** {display['overall_technical_score']}%",
+                            f"**Behavioral Score:** {display['overall_behavioral_score']}%",
+                            f"**Recommendation:** {candidate['assessment']['recommendation']}"
+                        ]))
                     
                     # Category breakdown
                     st.subheader("Skill Category Breakdown")
                     
                     if candidate['assessment'].get('category_scores'):
-                        categories = list(candidate['assessment']['category_scores'].keys())
-                        scores = list(candidate['assessment']['category_scores'].values())
-                        
-                        fig, ax = plt.subplots(figsize=(10, 5))
-                        y_pos = np.arange(len(categories))
-                        
-                        bars = ax.barh(y_pos, [s * 100 for s in scores])
-                        ax.set_yticks(y_pos)
-                        ax.set_yticklabels(categories)
-                        ax.set_xlabel('Score (%)')
-                        ax.set_title('Technical Skill Categories')
-                        
-                        # Add score labels
-                        for i, bar in enumerate(bars):
-                            ax.text(
-                                bar.get_width() + 1, 
-                                bar.get_y() + bar.get_height()/2, 
-                                f"{scores[i]*100:.1f}%", 
-                                va='center'
-                            )
-                        
+                        category_scores = candidate['assessment']['category_scores']
+                        scores_pct = np.asarray(list(category_scores.values())) * 100
+                        fig = _category_barh_fig(
+                            tuple(category_scores.keys()),
+                            tuple(scores_pct.tolist())
+                        )
                         st.pyplot(fig)
                     else:
                         st.info("No category scores available")
@@ -1,5 +1,6 @@
 # Create a script called train_models.py
 from models import TechnicalSkillsModel, BehavioralSkillsModel
+from joblib import Parallel, delayed
 import json
 import os
 
@@ -37,14 +38,28 @@ behavioral_train_data = {
     "scores": [0.85, 0.9, 0.8]
 }
 
-# Train technical model
-print("Training technical skills model...")
-tech_model = TechnicalSkillsModel()
-tech_model.train(technical_train_data, epochs=2)  # Reduced epochs for example
+# Number of models trained at the same time
+N_JOBS = 2
 
-# Train behavioral model
-print("Training behavioral skills model...")
-behav_model = BehavioralSkillsModel()
-behav_model.train(behavioral_train_data, epochs=2)  # Reduced epochs for example
 
-print("Training complete!")
+def _train(model_cls, data):
+    """Build and train a model inside a worker process"""
+    import torch
+    # Split the cores between the concurrent jobs instead of oversubscribing
+    torch.set_num_threads(max(1, (os.cpu_count() or 1) // N_JOBS))
+    model = model_cls()
+    model.train(data, epochs=2)  # Reduced epochs for example
+
+
+# The two models share no state, so train them in separate processes
+if __name__ == "__main__":
+    print("Training technical and behavioral skills models...")
+    Parallel(n_jobs=N_JOBS, backend='loky')(
+        delayed(_train)(model_cls, data)
+        for model_cls, data in [
+            (TechnicalSkillsModel, technical_train_data),
+            (BehavioralSkillsModel, behavioral_train_data)
+        ]
+    )
+
+    print("Training complete!")